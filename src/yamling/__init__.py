@@ -1,10 +1,18 @@
 __version__ = "1.7.1"
 
 import yaml
-from yamling.yaml_loaders import load_yaml, load_yaml_file, get_loader, YAMLInput
-from yamling.load_universal import load, load_file
+from yamling.yaml_loaders import (
+    load_yaml,
+    load_yaml_file,
+    load_many_yaml_files,
+    aload_yaml_file,
+    get_loader,
+    has_libyaml,
+    YAMLInput,
+)
+from yamling.load_universal import load, load_file, load_files
 from yamling.yaml_dumpers import dump_yaml
-from yamling.dump_universal import dump, dump_file
+from yamling.dump_universal import dump, dump_bytes, dump_file, dump_many
 from yamling.yamlparser import YAMLParser
 from yamling.exceptions import DumpingError, ParsingError
 from yamling.typedefs import SupportedFormats, FormatType, LoaderType
@@ -16,12 +24,18 @@ __all__ = [
     "load_yaml",
     "dump_yaml",
     "dump",
+    "dump_bytes",
     "dump_file",
+    "dump_many",
     "YAMLError",
     "load_yaml_file",
+    "load_many_yaml_files",
+    "aload_yaml_file",
     "get_loader",
+    "has_libyaml",
     "load",
     "load_file",
+    "load_files",
     "ParsingError",
     "DumpingError",
     "YAMLInput",
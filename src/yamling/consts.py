@@ -1,17 +1,20 @@
 from __future__ import annotations
 
 import importlib.util
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from yamling.typedefs import SupportedFormats
 
 
 # Check if orjson is available
 has_orjson = importlib.util.find_spec("orjson") is not None
 
-FORMAT_MAPPING: dict[str, SupportedFormats] = {
+FORMAT_MAPPING: Mapping[str, SupportedFormats] = MappingProxyType({
     ".yaml": "yaml",
     ".yml": "yaml",
     ".toml": "toml",
@@ -25,4 +28,4 @@ FORMAT_MAPPING: dict[str, SupportedFormats] = {
     ".properties": "ini",
     ".cnf": "ini",
     ".env": "ini",
-}
+})
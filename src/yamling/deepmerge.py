@@ -11,15 +11,21 @@ T = TypeVar("T")
 
 
 def merge_dict(merger: DeepMerger, source: Mapping, target: Mapping) -> Mapping:
+    # Dispatch on the value type up front instead of letting merger.merge
+    # raise TypeError for every scalar leaf - exception-driven control flow
+    # costs an order of magnitude more than a dict lookup per key.
     result = dict(target)
+    mergers = merger.mergers
     for key, source_value in source.items():
-        target_value = result[key] if key in result else type(source_value)()
-        try:
-            value = merger.merge(source_value, target_value)
-        except TypeError:
-            # can't merge, so overwrite
-            value = source_value
-        result[key] = value
+        submerger = mergers.get(type(source_value))
+        if submerger is None:
+            # unmergeable type, so overwrite
+            result[key] = source_value
+            continue
+        target_value = result.get(key)
+        if type(target_value) is not type(source_value):
+            target_value = type(source_value)()
+        result[key] = submerger(merger, source_value, target_value)
     return result
 
 
@@ -1,19 +1,173 @@
 from __future__ import annotations
 
 import dataclasses
-import importlib.util
 from io import StringIO
 import logging
+import os
+import pathlib
 from typing import TYPE_CHECKING, Any, get_args
 
 from yamling import consts, exceptions, typedefs
 
 
 if TYPE_CHECKING:
-    import os
+    from collections.abc import Callable, Iterable
+    import configparser
 
 logger = logging.getLogger(__name__)
 
+_SUPPORTED_FORMATS: frozenset[str] = frozenset(get_args(typedefs.SupportedFormats))
+
+try:
+    from pydantic import BaseModel as _PydanticBaseModel
+except ImportError:
+    _PydanticBaseModel = None  # type: ignore[assignment, misc]
+
+
+def _dump_yaml(data: Any, **kwargs: Any) -> str:
+    from yaml import YAMLError
+
+    from yamling import dump_yaml
+
+    try:
+        return dump_yaml(data, **kwargs)
+    except YAMLError as e:
+        logger.exception("Failed to dump YAML data")
+        msg = "Failed to dump data to YAML: %s"
+        raise exceptions.DumpingError(msg, e, original_error=e) from e
+
+
+def _dump_toml(data: Any, **kwargs: Any) -> str:
+    import tomli_w
+
+    try:
+        return tomli_w.dumps(data, **kwargs)
+    except Exception as e:
+        logger.exception("Failed to dump TOML data")
+        msg = "Failed to dump data to TOML: %s"
+        raise exceptions.DumpingError(msg, e, original_error=e) from e
+
+
+if consts.has_orjson:
+    import orjson
+
+    _ORJSON_OPT_INDENT_2 = orjson.OPT_INDENT_2
+
+    def _dump_json_bytes(data: Any, **kwargs: Any) -> bytes:
+        try:
+            if not kwargs:
+                return orjson.dumps(data, option=_ORJSON_OPT_INDENT_2)
+            # orjson only understands "default" and "option"; merge user flags
+            # with the indent default instead of clobbering them. "indent" is
+            # dropped - orjson does not accept it.
+            option = kwargs.get("option", 0) | _ORJSON_OPT_INDENT_2
+            return orjson.dumps(data, default=kwargs.get("default"), option=option)
+        except Exception as e:
+            logger.exception("Failed to dump JSON data with orjson")
+            msg = "Failed to dump data to JSON: %s"
+            raise exceptions.DumpingError(msg, e, original_error=e) from e
+
+    def _dump_json(data: Any, **kwargs: Any) -> str:
+        return _dump_json_bytes(data, **kwargs).decode("utf-8")
+
+else:
+
+    def _dump_json(data: Any, **kwargs: Any) -> str:
+        import json
+
+        try:
+            return json.dumps(data, indent=2, **kwargs)
+        except Exception as e:
+            logger.exception("Failed to dump JSON data with json")
+            msg = "Failed to dump data to JSON: %s"
+            raise exceptions.DumpingError(msg, e, original_error=e) from e
+
+
+def _validate_ini_structure(data: Any) -> None:
+    if not isinstance(data, dict):
+        msg = "INI format requires dict of dicts structure"
+        raise exceptions.DumpingError(msg)
+    for values in data.values():
+        if not isinstance(values, dict):
+            msg = "INI format requires dict of dicts structure"
+            raise exceptions.DumpingError(msg)
+
+
+def _fast_dump_ini(data: Any) -> str | None:
+    """Emit dict-of-dicts data as INI text without going through ConfigParser.
+
+    Mirrors ConfigParser's default output format (lowercased option names,
+    ``key = value``, blank line after each section). Returns None when the data
+    needs ConfigParser's handling - values with newlines (continuation lines)
+    or percent signs (interpolation escaping).
+    """
+    lines: list[str] = []
+    for section, values in data.items():
+        lines.append(f"[{section}]\n")
+        for key, value in values.items():
+            option = str(key).lower()
+            text = str(value)
+            if "\n" in option or "\n" in text or "%" in text:
+                return None
+            lines.append(f"{option} = {text}\n")
+        lines.append("\n")
+    return "".join(lines)
+
+
+def _build_ini_parser(data: Any, **kwargs: Any) -> configparser.ConfigParser:
+    """Build a ConfigParser populated with the given dict-of-dicts data."""
+    import configparser
+
+    parser = configparser.ConfigParser(**kwargs)
+    for section, values in data.items():
+        parser[str(section)] = {str(k): str(v) for k, v in values.items()}
+    return parser
+
+
+def _dump_ini(data: Any, **kwargs: Any) -> str:
+    try:
+        _validate_ini_structure(data)
+        if not kwargs and (text := _fast_dump_ini(data)) is not None:
+            return text
+        parser = _build_ini_parser(data, **kwargs)
+        output = StringIO()
+        parser.write(output)
+        return output.getvalue()
+    except exceptions.DumpingError:
+        raise
+    except Exception as e:
+        logger.exception("Failed to dump INI data")
+        msg = "Failed to dump data to INI: %s"
+        raise exceptions.DumpingError(msg, e, original_error=e) from e
+
+
+_DUMPERS: dict[str, Callable[..., str]] = {
+    "yaml": _dump_yaml,
+    "toml": _dump_toml,
+    "json": _dump_json,
+    "ini": _dump_ini,
+}
+
+
+def _prepare_data(data: Any) -> Any:
+    """Normalize pydantic models and dataclasses to plain data structures."""
+    if _PydanticBaseModel is not None and isinstance(data, _PydanticBaseModel):
+        return data.model_dump()
+    if dataclasses.is_dataclass(data) and not isinstance(data, type):
+        return dataclasses.asdict(data)
+    return data
+
+
+def _dump_bytes(data: Any, mode: str, **kwargs: Any) -> bytes | None:
+    """Return the serialized payload as bytes, or None to signal the text path.
+
+    Only formats whose backend natively produces bytes (JSON via orjson) take
+    this path - everything else goes through the str-based dumpers.
+    """
+    if mode == "json" and consts.has_orjson:
+        return _dump_json_bytes(data, **kwargs)
+    return None
+
 
 def dump(data: Any, mode: typedefs.SupportedFormats, **kwargs: Any) -> str:
     """Dump data to a string in the specified format.
@@ -30,102 +184,95 @@ def dump(data: Any, mode: typedefs.SupportedFormats, **kwargs: Any) -> str:
         ValueError: If the format is not supported
         DumpingError: If the data cannot be dumped in the specified format
     """
-    # Handle pydantic models
-    if importlib.util.find_spec("pydantic"):
-        import pydantic
+    data = _prepare_data(data)
+    try:
+        dumper = _DUMPERS[mode]
+    except KeyError:
+        msg = f"Unsupported format: {mode}"
+        raise ValueError(msg) from None
+    return dumper(data, **kwargs)
 
-        if isinstance(data, pydantic.BaseModel):
-            data = data.model_dump()
 
-    if dataclasses.is_dataclass(data) and not isinstance(data, type):
-        data = dataclasses.asdict(data)
-
-    match mode:
-        case "yaml":
-            from yaml import YAMLError
-
-            from yamling import dump_yaml
-
-            try:
-                return dump_yaml(data, **kwargs)
-            except YAMLError as e:
-                logger.exception("Failed to dump YAML data")
-                msg = f"Failed to dump data to YAML: {e}"
-                raise exceptions.DumpingError(msg, e) from e
-
-        case "toml":
-            import tomli_w
-
-            try:
-                return tomli_w.dumps(data, **kwargs)
-            except Exception as e:
-                logger.exception("Failed to dump TOML data")
-                msg = f"Failed to dump data to TOML: {e}"
-                raise exceptions.DumpingError(msg, e) from e
-
-        case "json":
-            if consts.has_orjson:
-                import orjson
-
-                try:
-                    valid_kwargs = {
-                        k: v
-                        for k, v in kwargs.items()
-                        if k in {"default", "option", "indent"}
-                    }
-                    return orjson.dumps(
-                        data, option=orjson.OPT_INDENT_2, **valid_kwargs
-                    ).decode("utf-8")
-                except Exception as e:
-                    logger.exception("Failed to dump JSON data with orjson")
-                    msg = f"Failed to dump data to JSON: {e}"
-                    raise exceptions.DumpingError(msg, e) from e
-            else:
-                import json
-
-                try:
-                    return json.dumps(data, indent=2, **kwargs)
-                except Exception as e:
-                    logger.exception("Failed to dump JSON data with json")
-                    msg = f"Failed to dump data to JSON: {e}"
-                    raise exceptions.DumpingError(msg, e) from e
-
-        case "ini":
-            import configparser
-
-            def validate_ini_structure(data: Any) -> None:
-                if not isinstance(data, dict):
-                    msg = "INI format requires dict of dicts structure"
-                    raise exceptions.DumpingError(msg)
-                for values in data.values():
-                    if not isinstance(values, dict):
-                        msg = "INI format requires dict of dicts structure"
-                        raise exceptions.DumpingError(msg)
-
-            try:
-                validate_ini_structure(data)
-                parser = configparser.ConfigParser(**kwargs)
-                for section, values in data.items():
-                    parser[str(section)] = {str(k): str(v) for k, v in values.items()}
-                output = StringIO()
-                parser.write(output)
-                return output.getvalue()
-            except exceptions.DumpingError:
-                raise
-            except Exception as e:
-                logger.exception("Failed to dump INI data")
-                msg = f"Failed to dump data to INI: {e}"
-                raise exceptions.DumpingError(msg, e) from e
-
-        case _:
-            msg = f"Unsupported format: {mode}"
-            raise ValueError(msg)
+def dump_bytes(data: Any, mode: typedefs.SupportedFormats, **kwargs: Any) -> bytes:
+    """Dump data to UTF-8 encoded bytes in the specified format.
+
+    For JSON with orjson available this returns the orjson output directly,
+    avoiding the decode/re-encode roundtrip that `dump` pays for a `str` result.
+
+    Args:
+        data: Data structure to dump (also accepts pydantic v2 models and dataclasses)
+        mode: Format to dump the data in ("yaml", "toml", "json", or "ini")
+        **kwargs: Additional keyword arguments passed to the underlying dump functions
+
+    Returns:
+        bytes: UTF-8 encoded payload
+
+    Raises:
+        ValueError: If the format is not supported
+        DumpingError: If the data cannot be dumped in the specified format
+    """
+    data = _prepare_data(data)
+    if (payload := _dump_bytes(data, mode, **kwargs)) is not None:
+        return payload
+    try:
+        dumper = _DUMPERS[mode]
+    except KeyError:
+        msg = f"Unsupported format: {mode}"
+        raise ValueError(msg) from None
+    return dumper(data, **kwargs).encode("utf-8")
+
+
+def dump_many(
+    records: Iterable[Any],
+    mode: typedefs.SupportedFormats,
+    sep: bytes = b"\n",
+    **kwargs: Any,
+) -> bytes:
+    """Dump multiple records into a single bytes payload.
+
+    Serializing in one call amortizes the per-record dispatch and format
+    handling of `dump` and produces one buffer suitable for a single write.
+    JSON records are joined with `sep` (NDJSON-style for the default newline);
+    YAML records become a multi-document stream via `yaml.dump_all`.
+
+    Args:
+        records: Iterable of data structures to dump
+        mode: Format to dump the records in ("yaml", "toml", "json", or "ini")
+        sep: Separator inserted between records (ignored for YAML, which uses
+             document markers)
+        **kwargs: Additional keyword arguments passed to the underlying dump functions
+
+    Returns:
+        bytes: UTF-8 encoded concatenation of all records
+
+    Raises:
+        ValueError: If the format is not supported
+        DumpingError: If a record cannot be dumped in the specified format
+    """
+    items = [_prepare_data(record) for record in records]
+    if mode == "yaml":
+        import yaml
+
+        from yamling import yaml_dumpers
+
+        dumper_cls = yaml_dumpers._get_dumper_cls(kwargs.pop("class_mappings", None))
+        try:
+            return yaml.dump_all(items, Dumper=dumper_cls, **kwargs).encode("utf-8")
+        except yaml.YAMLError as e:
+            logger.exception("Failed to dump YAML documents")
+            msg = "Failed to dump data to YAML: %s"
+            raise exceptions.DumpingError(msg, e, original_error=e) from e
+    if mode not in _SUPPORTED_FORMATS:
+        msg = f"Unsupported format: {mode}"
+        raise ValueError(msg)
+    return sep.join(dump_bytes(item, mode, **kwargs) for item in items)
 
 
 def dump_file(
     data: Any,
     path: str | os.PathLike[str],
     mode: typedefs.FormatType = "auto",
+    write_cache: bool = False,
     **kwargs: Any,
 ) -> None:
     """Dump data to a file, automatically detecting the format from extension if needed.
@@ -134,38 +281,65 @@ def dump_file(
         data: Data structure to dump
         path: Path to the file to write
         mode: Format to write the file in ("yaml", "toml", "json", "ini" or "auto")
+        write_cache: Whether to also write a pickled sidecar (`<path>.pcache`)
+                     so `load_file(..., use_cache=True)` can skip re-parsing.
+                     The sidecar is considered valid as long as its mtime is
+                     not older than the file itself.
         **kwargs: Additional keyword arguments passed to the underlying dump functions
 
     Raises:
         ValueError: If the format cannot be determined or is not supported
         DumpingError: If the data cannot be dumped or the file cannot be written
     """
-    import upath
-
-    path_obj = upath.UPath(path)
-
-    # Determine format from extension if auto mode
+    # Determine format from extension if auto mode (cheap string ops, no need
+    # to materialize a path object first)
     if mode == "auto":
-        ext = path_obj.suffix.lower()
+        ext = os.path.splitext(str(path))[1].lower()  # noqa: PTH122
         detected_mode = consts.FORMAT_MAPPING.get(ext)
         if detected_mode is None:
             msg = f"Could not determine format from file extension: {path}"
             raise ValueError(msg)
         mode = detected_mode
 
+    # Local paths take the plain pathlib route; UPath (fsspec dispatch) is only
+    # needed for remote URIs.
+    path_obj: pathlib.Path
+    if "://" not in str(path):
+        path_obj = pathlib.Path(path)
+    else:
+        import upath
+
+        path_obj = upath.UPath(path)
+
     # At this point, mode can't be "auto"
-    if mode not in get_args(typedefs.SupportedFormats):
+    if mode not in _SUPPORTED_FORMATS:
         msg = f"Unsupported format: {mode}"
         raise ValueError(msg)
 
     try:
-        text = dump(data, mode, **kwargs)
-        path_obj.write_text(text)
+        prepared = _prepare_data(data)
+        if (payload := _dump_bytes(prepared, mode, **kwargs)) is not None:
+            path_obj.write_bytes(payload)
+        elif mode == "ini":
+            # Stream the parser output straight into the file instead of
+            # materializing it in a StringIO first.
+            _validate_ini_structure(prepared)
+            parser = _build_ini_parser(prepared, **kwargs)
+            with path_obj.open("w") as f:
+                parser.write(f)
+        else:
+            text = dump(prepared, mode, **kwargs)
+            path_obj.write_text(text)
+        if write_cache:
+            import pickle
+
+            with path_obj.with_name(path_obj.name + ".pcache").open("wb") as f:
+                pickle.dump(prepared, f, protocol=pickle.HIGHEST_PROTOCOL)
     except (OSError, PermissionError) as e:
         logger.exception("Failed to write file %r", path)
-        msg = f"Failed to write file {path}: {e!s}"
-        raise exceptions.DumpingError(msg, e) from e
+        msg = "Failed to write file %s: %s"
+        raise exceptions.DumpingError(msg, path, e, original_error=e) from e
     except Exception as e:
         logger.exception("Failed to dump data to %r as %s", path, mode)
-        msg = f"Failed to dump data to {path} as {mode} format: {e!s}"
-        raise exceptions.DumpingError(msg, e) from e
+        msg = "Failed to dump data to %s as %s format: %s"
+        raise exceptions.DumpingError(msg, path, mode, e, original_error=e) from e
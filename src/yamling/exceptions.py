@@ -1,17 +1,44 @@
 from __future__ import annotations
 
+from typing import Any
 
-class DumpingError(Exception):
-    """Common exception for all dumping errors in yamling."""
 
-    def __init__(self, message: str, original_error: Exception | None = None) -> None:
-        super().__init__(message)
+class _LazyFormatError(Exception):
+    """Exception base that defers %-formatting of its message until str().
+
+    Callers pass a printf-style template plus arguments (mirroring logging's
+    deferred formatting), so raising on hot paths does not pay for string
+    interpolation unless someone actually reads the message.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *args: Any,
+        original_error: Exception | None = None,
+    ) -> None:
+        # Backwards compatibility with the old (message, original_error)
+        # positional form: a sole trailing exception is the original error,
+        # never a format argument. Template callers that want an exception
+        # interpolated pass original_error explicitly (see dump_universal),
+        # which skips this branch.
+        if original_error is None and len(args) == 1 and isinstance(args[0], Exception):
+            original_error = args[0]
+            args = ()
+        super().__init__(message, *args)
+        self._message = message
+        self._format_args = args
         self.original_error = original_error
 
+    def __str__(self) -> str:
+        if self._format_args:
+            return self._message % self._format_args
+        return self._message
 
-class ParsingError(Exception):
-    """Common exception for all parsing errors in yamling."""
 
-    def __init__(self, message: str, original_error: Exception | None = None) -> None:
-        super().__init__(message)
-        self.original_error = original_error
+class DumpingError(_LazyFormatError):
+    """Common exception for all dumping errors in yamling."""
+
+
+class ParsingError(_LazyFormatError):
+    """Common exception for all parsing errors in yamling."""
@@ -1,38 +1,131 @@
 from __future__ import annotations
 
-import configparser
+import copy
 import json
 import logging
-from typing import TYPE_CHECKING, Any, TypeVar, get_args, overload
+import os
+import pathlib
+import pickle
+import threading
+import tomllib
+from typing import TYPE_CHECKING, Any, TypeVar, overload
 
-import upath
+from yaml import YAMLError
 
 from yamling import consts, exceptions, typedefs
+from yamling.yaml_loaders import load_yaml
 
 
 if TYPE_CHECKING:
-    import os
+    from collections.abc import Callable, Iterable
 
 T = TypeVar("T")
 
 
 logger = logging.getLogger(__name__)
 
+if consts.has_orjson:
+    import orjson
+
+
+def _load_yaml(text: str | bytes, **kwargs: Any) -> Any:
+    try:
+        return load_yaml(text, **kwargs)
+    except YAMLError as e:
+        logger.exception("Failed to load YAML data")
+        msg = "Failed to parse YAML data: %s"
+        raise exceptions.ParsingError(msg, e, original_error=e) from e
+
+
+def _load_toml(text: str | bytes, **kwargs: Any) -> Any:
+    if isinstance(text, bytes):
+        text = text.decode("utf-8")
+    try:
+        return tomllib.loads(text, **kwargs)
+    except tomllib.TOMLDecodeError as e:
+        logger.exception("Failed to load TOML data")
+        msg = "Failed to parse TOML data: %s"
+        raise exceptions.ParsingError(msg, e, original_error=e) from e
+
+
+if consts.has_orjson:
+
+    def _load_json(text: str | bytes, **kwargs: Any) -> Any:
+        try:
+            # orjson.loads takes no keyword arguments and parses bytes
+            # directly, skipping a UTF-8 decode pass.
+            return orjson.loads(text)
+        except orjson.JSONDecodeError as e:
+            logger.exception("Failed to load JSON data with orjson")
+            msg = "Failed to parse JSON data: %s"
+            raise exceptions.ParsingError(msg, e, original_error=e) from e
+
+else:
+
+    def _load_json(text: str | bytes, **kwargs: Any) -> Any:
+        try:
+            return json.loads(text, **kwargs)
+        except json.JSONDecodeError as e:
+            logger.exception("Failed to load JSON data with json")
+            msg = "Failed to parse JSON data: %s"
+            raise exceptions.ParsingError(msg, e, original_error=e) from e
+
+
+def _load_ini(text: str | bytes, **kwargs: Any) -> Any:
+    # configparser pulls in a fair amount of machinery; INI is the least
+    # common format here, so only pay for it when actually parsing one.
+    import configparser
+
+    if isinstance(text, bytes):
+        text = text.decode("utf-8")
+    try:
+        # Interpolation (and its %%-unescaping) only matters when a percent
+        # sign occurs; without one, RawConfigParser produces identical output
+        # while skipping the per-value interpolation pass.
+        if not kwargs and "%" not in text:
+            parser: configparser.RawConfigParser = configparser.RawConfigParser()
+        else:
+            parser = configparser.ConfigParser(**kwargs)
+        parser.read_string(text)
+        return {section: dict(parser.items(section)) for section in parser.sections()}
+    except (
+        configparser.Error,
+        configparser.ParsingError,
+        configparser.MissingSectionHeaderError,
+    ) as e:
+        logger.exception("Failed to load INI data")
+        msg = "Failed to parse INI data: %s"
+        raise exceptions.ParsingError(msg, e, original_error=e) from e
+
+
+_LOADERS: dict[str, Callable[..., Any]] = {
+    "yaml": _load_yaml,
+    "toml": _load_toml,
+    "json": _load_json,
+    "ini": _load_ini,
+}
+
 
 @overload
 def load(
-    text: str, mode: typedefs.SupportedFormats, verify_type: None = None, **kwargs: Any
+    text: str | bytes,
+    mode: typedefs.SupportedFormats,
+    verify_type: None = None,
+    **kwargs: Any,
 ) -> Any: ...
 
 
 @overload
 def load(
-    text: str, mode: typedefs.SupportedFormats, verify_type: type[T], **kwargs: Any
+    text: str | bytes,
+    mode: typedefs.SupportedFormats,
+    verify_type: type[T],
+    **kwargs: Any,
 ) -> T: ...
 
 
 def load(
-    text: str,
+    text: str | bytes,
     mode: typedefs.SupportedFormats,
     verify_type: type[T] | None = None,
     **kwargs: Any,
@@ -40,7 +133,7 @@ def load(
     """Load data from a string in the specified format.
 
     Args:
-        text: String containing data in the specified format
+        text: String (or UTF-8 bytes) containing data in the specified format
         mode: Format of the input data ("yaml", "toml", "json", or "ini")
         verify_type: Type to verify and cast the output to
         **kwargs: Additional keyword arguments passed to the underlying load functions
@@ -63,69 +156,12 @@ def load(
         items = load('["item1", "item2"]', mode="json", verify_type=list)
         ```
     """
-    match mode:
-        case "yaml":
-            from yaml import YAMLError
-
-            from yamling.yaml_loaders import load_yaml
-
-            try:
-                data = load_yaml(text, **kwargs)
-            except YAMLError as e:
-                logger.exception("Failed to load YAML data")
-                msg = f"Failed to parse YAML data: {e}"
-                raise exceptions.ParsingError(msg, e) from e
-
-        case "toml":
-            import tomllib
-
-            try:
-                data = tomllib.loads(text, **kwargs)
-            except tomllib.TOMLDecodeError as e:
-                logger.exception("Failed to load TOML data")
-                msg = f"Failed to parse TOML data: {e}"
-                raise exceptions.ParsingError(msg, e) from e
-
-        case "json":
-            if consts.has_orjson:
-                import orjson
-
-                try:
-                    valid_kwargs = {
-                        k: v for k, v in kwargs.items() if k in {"default", "option"}
-                    }
-                    data = orjson.loads(text, **valid_kwargs)
-                except orjson.JSONDecodeError as e:
-                    logger.exception("Failed to load JSON data with orjson")
-                    msg = f"Failed to parse JSON data: {e}"
-                    raise exceptions.ParsingError(msg, e) from e
-            else:
-                try:
-                    data = json.loads(text, **kwargs)
-                except json.JSONDecodeError as e:
-                    logger.exception("Failed to load JSON data with json")
-                    msg = f"Failed to parse JSON data: {e}"
-                    raise exceptions.ParsingError(msg, e) from e
-
-        case "ini":
-            try:
-                parser = configparser.ConfigParser(**kwargs)
-                parser.read_string(text)
-                data = {
-                    section: dict(parser.items(section)) for section in parser.sections()
-                }
-            except (
-                configparser.Error,
-                configparser.ParsingError,
-                configparser.MissingSectionHeaderError,
-            ) as e:
-                logger.exception("Failed to load INI data")
-                msg = f"Failed to parse INI data: {e}"
-                raise exceptions.ParsingError(msg, e) from e
-
-        case _:
-            msg = f"Unsupported format: {mode}"
-            raise ValueError(msg)
+    try:
+        loader = _LOADERS[mode]
+    except KeyError:
+        msg = f"Unsupported format: {mode}"
+        raise ValueError(msg) from None
+    data = loader(text, **kwargs)
 
     if verify_type is not None:
         if not isinstance(data, verify_type):
@@ -138,11 +174,78 @@ def load(
     return data
 
 
+# In-memory parse cache for load_file(use_cache=True), keyed on path identity
+# plus stat fingerprint so edits invalidate entries automatically. Cached values
+# are deep-copied on return to preserve mutation safety for callers.
+_PARSE_CACHE: dict[tuple[str, int, int, str], Any] = {}
+_PARSE_CACHE_LOCK = threading.Lock()
+_PARSE_CACHE_MAXSIZE = 256
+
+
+def _parse_cache_key(path_obj: pathlib.Path, mode: str) -> tuple[str, int, int, str]:
+    st = path_obj.stat()
+    mtime_ns = getattr(st, "st_mtime_ns", None) or int(st.st_mtime * 1e9)
+    return (str(path_obj), mtime_ns, st.st_size, mode)
+
+
+def clear_cache() -> None:
+    """Drop all in-memory parse-cache entries held for `load_file(use_cache=True)`."""
+    _PARSE_CACHE.clear()
+
+
+def _to_path(
+    path: str | os.PathLike[str],
+    storage_options: dict[str, Any] | None = None,
+) -> pathlib.Path:
+    """Build a path object, taking the plain pathlib route for local paths.
+
+    UPath (fsspec dispatch) is only needed for remote URIs or when
+    storage_options are given; for local files its protocol resolution is
+    pure overhead.
+    """
+    if not storage_options and "://" not in str(path):
+        return pathlib.Path(path)
+    import upath
+
+    return upath.UPath(path, **storage_options or {})
+
+
+def _read_source(path_obj: pathlib.Path, mode: str) -> str | bytes:
+    """Read the file in the cheapest form the parser for `mode` accepts.
+
+    YAML and JSON are returned as raw bytes - libyaml and orjson both decode
+    UTF-8 internally in C, so the separate Python-level decode pass is pure
+    overhead. TOML and INI parsers require str input.
+    """
+    if mode in ("yaml", "json"):
+        return path_obj.read_bytes()
+    return path_obj.read_text(encoding="utf-8")
+
+
+def _load_pickle_cache(path_obj: pathlib.Path) -> tuple[Any] | None:
+    """Return the unpickled `<path>.pcache` sidecar payload if it is fresh.
+
+    The sidecar is written by `dump_file(..., write_cache=True)` and is valid
+    as long as its mtime is not older than the source file. Returns a 1-tuple
+    wrapping the payload (so `None` payloads stay distinguishable), or None
+    when there is no usable cache.
+    """
+    cache_obj = path_obj.with_name(path_obj.name + ".pcache")
+    try:
+        if cache_obj.stat().st_mtime < path_obj.stat().st_mtime:
+            return None
+        with cache_obj.open("rb") as f:
+            return (pickle.load(f),)
+    except (OSError, pickle.PickleError):
+        return None
+
+
 @overload
 def load_file(
     path: str | os.PathLike[str],
     mode: typedefs.FormatType = "auto",
     storage_options: dict[str, Any] | None = None,
+    use_cache: bool = False,
     verify_type: None = None,
 ) -> Any: ...
 
@@ -152,6 +255,7 @@ def load_file(
     path: str | os.PathLike[str],
     mode: typedefs.FormatType = "auto",
     storage_options: dict[str, Any] | None = None,
+    use_cache: bool = False,
     verify_type: type[T] = ...,
 ) -> T: ...
 
@@ -160,6 +264,7 @@ def load_file(
     path: str | os.PathLike[str],
     mode: typedefs.FormatType = "auto",
     storage_options: dict[str, Any] | None = None,
+    use_cache: bool = False,
     verify_type: type[T] | None = None,
 ) -> Any | T:
     """Load data from a file, automatically detecting the format from extension if needed.
@@ -168,6 +273,13 @@ def load_file(
         path: Path to the file to load
         mode: Format of the file ("yaml", "toml", "json", "ini" or "auto")
         storage_options: Additional keyword arguments to pass to the fsspec backend
+        use_cache: Whether to reuse previously parsed results instead of
+                   re-parsing. Checks an in-memory cache keyed on the file's
+                   path, mtime and size first, then a pickled sidecar
+                   (`<path>.pcache`) written by
+                   `dump_file(..., write_cache=True)` when the sidecar is at
+                   least as new as the file. Cached values are deep-copied on
+                   return, so mutating the result never pollutes the cache
         verify_type: Type to verify and cast the output to
 
     Returns:
@@ -193,7 +305,7 @@ def load_file(
         items = load_file("items.yaml", verify_type=list)
         ```
     """
-    path_obj = upath.UPath(path, **storage_options or {})
+    path_obj = _to_path(path, storage_options)
 
     # Determine format from extension if auto mode
     if mode == "auto":
@@ -205,13 +317,29 @@ def load_file(
         mode = detected_mode
 
     # At this point, mode can't be "auto"
-    if mode not in get_args(typedefs.SupportedFormats):
+    if mode not in _LOADERS:
         msg = f"Unsupported format: {mode}"
         raise ValueError(msg)
 
     try:
-        text = path_obj.read_text(encoding="utf-8")
-        data = load(text, mode)
+        if use_cache:
+            key = _parse_cache_key(path_obj, mode)
+            if key in _PARSE_CACHE:
+                data = copy.deepcopy(_PARSE_CACHE[key])
+            else:
+                if (cached := _load_pickle_cache(path_obj)) is not None:
+                    data = cached[0]
+                else:
+                    data = load(_read_source(path_obj, mode), mode)
+                value = copy.deepcopy(data)
+                # load_files(use_cache=True) mutates this cache from several
+                # threads; the lock keeps eviction from racing.
+                with _PARSE_CACHE_LOCK:
+                    if len(_PARSE_CACHE) >= _PARSE_CACHE_MAXSIZE:
+                        _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+                    _PARSE_CACHE[key] = value
+        else:
+            data = load(_read_source(path_obj, mode), mode)
     except (OSError, FileNotFoundError, PermissionError) as e:
         logger.exception("Failed to read file %r", path)
         msg = f"Failed to read file {path}: {e!s}"
@@ -230,3 +358,89 @@ def load_file(
                 raise TypeError(msg)
             return data  # type: ignore[no-any-return]
         return data
+
+
+def _detect_mode(path: str | os.PathLike[str], mode: typedefs.FormatType) -> str:
+    """Resolve 'auto' to a concrete format from the file extension."""
+    if mode != "auto":
+        return mode
+    ext = os.path.splitext(str(path))[1].lower()  # noqa: PTH122
+    detected_mode = consts.FORMAT_MAPPING.get(ext)
+    if detected_mode is None:
+        msg = f"Could not determine format from file extension: {path}"
+        raise ValueError(msg)
+    return detected_mode
+
+
+def load_files(
+    paths: Iterable[str | os.PathLike[str]],
+    mode: typedefs.FormatType = "auto",
+    storage_options: dict[str, Any] | None = None,
+    use_cache: bool = False,
+) -> list[Any]:
+    """Load multiple files, batching I/O where the backend allows it.
+
+    Remote paths sharing an fsspec protocol are fetched with one batched
+    `fs.cat` call (a single round of concurrent requests on backends like
+    HTTP/S3) instead of per-file open/read round-trips; local paths load
+    through a thread pool. Results come back in input order.
+
+    Args:
+        paths: Paths to the files to load
+        mode: Format of the files ("yaml", "toml", "json", "ini" or "auto")
+        storage_options: Additional keyword arguments to pass to the fsspec backend
+        use_cache: Whether to reuse previously parsed results for local files
+                   (see `load_file`)
+
+    Returns:
+        List of parsed data structures, in the same order as the input paths
+
+    Raises:
+        ValueError: If a format cannot be determined or is not supported
+        OSError: If a file cannot be read
+        ParsingError: If a file cannot be parsed in its format
+
+    Example:
+        ```python
+        configs = load_files(["a.yml", "b.yml", "s3://bucket/c.yml"])
+        ```
+    """
+    path_list = list(paths)
+    results: dict[int, Any] = {}
+
+    # Group remote URIs by protocol for batched reads
+    remote: dict[str, list[tuple[int, str]]] = {}
+    local: list[tuple[int, str | os.PathLike[str]]] = []
+    for idx, path in enumerate(path_list):
+        text = str(path)
+        if "://" in text:
+            protocol = text.split("://", 1)[0]
+            remote.setdefault(protocol, []).append((idx, text))
+        else:
+            local.append((idx, path))
+
+    for protocol, entries in remote.items():
+        import fsspec
+
+        fs = fsspec.filesystem(protocol, **storage_options or {})
+        urls = [url for _idx, url in entries]
+        payloads = fs.cat(urls)
+        for idx, url in entries:
+            # Some backends key the result dict on protocol-stripped paths
+            payload = payloads.get(url, payloads.get(fs._strip_protocol(url)))
+            results[idx] = load(payload, _detect_mode(url, mode))  # type: ignore[call-overload]
+
+    if len(local) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(local))) as executor:
+            loaded = executor.map(
+                lambda entry: load_file(entry[1], mode, use_cache=use_cache), local
+            )
+            for (idx, _path), data in zip(local, loaded):
+                results[idx] = data
+    elif local:
+        idx, path = local[0]
+        results[idx] = load_file(path, mode, use_cache=use_cache)
+
+    return [results[idx] for idx in range(len(path_list))]
@@ -8,19 +8,27 @@ import yaml
 YAMLPrimitive = str | int | float | bool | None
 YAMLValue = YAMLPrimitive | dict[str, Any] | list[Any]
 
-LoaderType = type[
-    yaml.Loader
-    | yaml.CLoader
-    | yaml.UnsafeLoader
-    | yaml.CUnsafeLoader
-    | yaml.FullLoader
-    | yaml.CFullLoader
-    | yaml.SafeLoader
-    | yaml.CSafeLoader
-]
-LoaderStr = Literal["unsafe", "full", "safe"]
+# The C loader/dumper classes only exist when PyYAML was built against
+# libyaml, so they can't appear unconditionally in runtime type expressions.
+if yaml.__with_libyaml__:
+    LoaderType = type[
+        yaml.Loader
+        | yaml.CLoader
+        | yaml.UnsafeLoader
+        | yaml.CUnsafeLoader
+        | yaml.FullLoader
+        | yaml.CFullLoader
+        | yaml.SafeLoader
+        | yaml.CSafeLoader
+    ]
+    DumperType = type[yaml.Dumper | yaml.CDumper | yaml.SafeDumper | yaml.CSafeDumper]
+else:
+    LoaderType = type[  # type: ignore[misc]
+        yaml.Loader | yaml.UnsafeLoader | yaml.FullLoader | yaml.SafeLoader
+    ]
+    DumperType = type[yaml.Dumper | yaml.SafeDumper]  # type: ignore[misc]
 
-DumperType = type[yaml.Dumper | yaml.CDumper | yaml.SafeDumper | yaml.CSafeDumper]
+LoaderStr = Literal["unsafe", "full", "safe"]
 
 SupportedFormats = Literal["yaml", "toml", "json", "ini"]
 FormatType = SupportedFormats | Literal["auto"]
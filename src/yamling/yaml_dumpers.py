@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import dataclasses
-import importlib.util
-from typing import TYPE_CHECKING, Any
+import os
+import threading
+from typing import Any
 
 import upath
 import yaml
@@ -12,8 +13,51 @@ import yaml
 from yamling import typedefs, utils
 
 
-if TYPE_CHECKING:
-    import os
+try:
+    from pydantic import BaseModel as _PydanticBaseModel
+except ImportError:
+    _PydanticBaseModel = None  # type: ignore[assignment, misc]
+
+
+# Prefer the libyaml C emitter when PyYAML was built with it - emission is an
+# order of magnitude faster than the pure-Python Dumper. CDumper uses the same
+# Representer as yaml.Dumper, so the output is identical. Set YAMLING_PURE_PYTHON
+# to force the pure-Python emitter (e.g. for custom tag hooks incompatible with
+# the C emitter).
+DUMPER: typedefs.DumperType = (
+    yaml.Dumper
+    if os.environ.get("YAMLING_PURE_PYTHON")
+    else getattr(yaml, "CDumper", yaml.Dumper)
+)
+
+# Memoize the generated Dumper subclasses so repeated dumps with the same
+# class_mappings (the common config-serialization case) skip per-call class
+# creation and representer registration.
+_DUMPER_CACHE: dict[frozenset[tuple[type, type]] | None, typedefs.DumperType] = {}
+_DUMPER_CACHE_LOCK = threading.Lock()
+
+
+def _get_dumper_cls(
+    class_mappings: dict[type, type] | None = None,
+) -> typedefs.DumperType:
+    """Return a (cached) Dumper subclass configured for the given class mappings.
+
+    Args:
+        class_mappings: Dict mapping classes to built-in types for YAML representation
+
+    Returns:
+        Dumper subclass with the requested representers registered
+    """
+    key = frozenset(class_mappings.items()) if class_mappings else None
+    with _DUMPER_CACHE_LOCK:
+        dumper_cls = _DUMPER_CACHE.get(key)
+        if dumper_cls is None:
+            dumper_cls = utils.create_subclass(DUMPER)
+            if class_mappings:
+                for class_type, target_type in class_mappings.items():
+                    map_class_to_builtin_type(dumper_cls, class_type, target_type)
+            _DUMPER_CACHE[key] = dumper_cls
+    return dumper_cls
 
 
 def map_class_to_builtin_type(
@@ -59,15 +103,9 @@ def dump_yaml(
     Returns:
         YAML string representation
     """
-    dumper_cls = utils.create_subclass(yaml.Dumper)
-    if class_mappings:
-        for class_type, target_type in class_mappings.items():
-            map_class_to_builtin_type(dumper_cls, class_type, target_type)
-    if importlib.util.find_spec("pydantic"):
-        import pydantic
-
-        if isinstance(obj, pydantic.BaseModel):
-            obj = obj.model_dump()
+    dumper_cls = _get_dumper_cls(class_mappings)
+    if _PydanticBaseModel is not None and isinstance(obj, _PydanticBaseModel):
+        obj = obj.model_dump()
     if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
         obj = dataclasses.asdict(obj)
     return yaml.dump(obj, Dumper=dumper_cls, **kwargs)
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 import os
+import pathlib
+import re
+import sys
+import threading
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar, overload
 
 import fsspec
+import upath
 import yaml
 import yaml_include
 
@@ -14,17 +21,36 @@ from yamling import deepmerge, typedefs, utils
 from yamling.constructors import variable
 
 
-if TYPE_CHECKING:
-    from collections.abc import Callable
-
+try:
     import jinja2
+except ImportError:
+    jinja2 = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
 
 logger = logging.getLogger(__name__)
 
+
+def has_libyaml() -> bool:
+    """Whether PyYAML was built with the libyaml C accelerators."""
+    return bool(getattr(yaml, "__with_libyaml__", False))
+
+
+if not has_libyaml():
+    logger.warning(
+        "PyYAML was built without libyaml; falling back to the pure-Python "
+        "loaders, which parse several times slower. Install the libyaml "
+        "headers and reinstall PyYAML (e.g. pip install --no-binary pyyaml "
+        "pyyaml) to enable the C accelerators."
+    )
+
+# Prefer the libyaml-backed loaders, falling back to the pure-Python ones when
+# PyYAML was built without the C extension.
 LOADERS: dict[str, typedefs.LoaderType] = {
-    "unsafe": yaml.CUnsafeLoader,
-    "full": yaml.CFullLoader,
-    "safe": yaml.CSafeLoader,
+    "unsafe": getattr(yaml, "CUnsafeLoader", yaml.UnsafeLoader),
+    "full": getattr(yaml, "CFullLoader", yaml.FullLoader),
+    "safe": getattr(yaml, "CSafeLoader", yaml.SafeLoader),
 }
 T = TypeVar("T", bound=type)
 
@@ -39,6 +65,10 @@ class SupportsRead(Protocol[_T_co]):
 
 YAMLInput = str | bytes | SupportsRead[str] | SupportsRead[bytes]
 
+# Local files above this size are handed to the parser as an open stream so
+# libyaml reads incrementally instead of the whole file being buffered first.
+_STREAM_SIZE_THRESHOLD = 1 << 20  # 1 MiB
+
 
 def get_env_constructor(loader: yaml.Loader, node: yaml.Node) -> Any:
     """Construct a YAML tag that references environment variables.
@@ -83,6 +113,50 @@ def get_env_constructor(loader: yaml.Loader, node: yaml.Node) -> Any:
     return default
 
 
+# Matches the opening of any Jinja2 delimiter ({{, {%, {#); strings without
+# one render to themselves and never need to touch Jinja at all.
+_TEMPLATE_SENTINEL = re.compile(r"\{[{%#]")
+
+
+@functools.lru_cache(maxsize=32)
+def _template_sentinel(env: jinja2.Environment) -> re.Pattern[str]:
+    """Return the delimiter fast-reject pattern for an environment.
+
+    Environments configured with custom delimiters get a pattern built from
+    their own start strings, so the fast path never skips a real template.
+    """
+    starts = (
+        env.variable_start_string,
+        env.block_start_string,
+        env.comment_start_string,
+    )
+    if starts == ("{{", "{%", "{#"):
+        return _TEMPLATE_SENTINEL
+    return re.compile("|".join(re.escape(s) for s in starts))
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_template(env: jinja2.Environment, source: str) -> jinja2.Template:
+    """Compile a Jinja2 template, caching per (environment, source) pair.
+
+    Configs tend to repeat string values, and compiling (AST build + codegen)
+    dominates rendering for short templates, so this pays off quickly.
+    """
+    return env.from_string(source)
+
+
+@functools.lru_cache(maxsize=2048)
+def _render_key(env: jinja2.Environment, source: str) -> str:
+    """Render a templated dict key, caching the result per (environment, source).
+
+    Key names repeat heavily across mappings in a typical config, so caching
+    the rendered string (not just the compiled template) skips rendering
+    entirely on repeats. Only valid because key templates take no dynamic
+    render context, so the same source always renders to the same string.
+    """
+    return _compile_template(env, source).render()
+
+
 def get_jinja2_constructor(
     env: jinja2.Environment | None,
     resolve_strings: bool = True,
@@ -98,7 +172,11 @@ def get_jinja2_constructor(
     Returns:
         Constructor function for YAML loader
     """
-    import jinja2
+    if jinja2 is None:
+        msg = "jinja2 is required for Jinja2 template resolution"
+        raise ImportError(msg)
+
+    sentinel = _template_sentinel(env) if env is not None else _TEMPLATE_SENTINEL
 
     def construct_jinja2_str(loader: yaml.Loader, node: yaml.Node) -> Any:  # noqa: PLR0911
         try:
@@ -108,8 +186,8 @@ def get_jinja2_constructor(
             match node:
                 case yaml.ScalarNode():
                     value = loader.construct_scalar(node)
-                    if isinstance(value, str):
-                        return env.from_string(value).render()  # Remove inner try-except
+                    if isinstance(value, str) and sentinel.search(value):
+                        return _compile_template(env, value).render()
                     return value
 
                 case yaml.MappingNode():
@@ -117,8 +195,8 @@ def get_jinja2_constructor(
                     if resolve_dict_keys:
                         return {
                             (
-                                env.from_string(str(k)).render()
-                                if isinstance(k, str)
+                                _render_key(env, k)
+                                if isinstance(k, str) and sentinel.search(k)
                                 else k
                             ): v
                             for k, v in value.items()
@@ -133,19 +211,30 @@ def get_jinja2_constructor(
 
         except jinja2.TemplateError:  # Handle Jinja2 errors separately
             raise  # Re-raise Jinja2 errors
-        except Exception:  # Handle other exceptions
-            logger.exception("Error in Jinja2 constructor")
+        except Exception as exc:  # noqa: BLE001  # any constructor error falls back
+            # A broken config can hit this once per scalar; a plain warning
+            # avoids formatting a full traceback for each of them.
+            logger.warning("Error in Jinja2 constructor: %r", exc)
             return loader.construct_scalar(node)
 
     return construct_jinja2_str
 
 
+# Memoized include constructors: fsspec.url_to_fs performs URL parsing and
+# registry lookups on every call, and Constructor instances are stateless
+# apart from their filesystem, so identical specs can share one instance.
+_INCLUDE_CONSTRUCTOR_CACHE: dict[Any, yaml_include.Constructor] = {}
+
+
 def get_include_constructor(
     fs: str | os.PathLike[str] | fsspec.AbstractFileSystem | None = None,
     **kwargs: Any,
 ) -> yaml_include.Constructor:
     """Create a YAML include (!include) constructor with fsspec filesystem support.
 
+    Constructors are memoized per filesystem spec (when no extra kwargs are
+    given), so repeated calls reuse the resolved filesystem instance.
+
     Args:
         fs: Filesystem specification (path or fsspec filesystem object)
         kwargs: Additional arguments for the Constructor
@@ -153,6 +242,14 @@ def get_include_constructor(
     Returns:
         Configured YAML include constructor
     """
+    cache_key: Any = None
+    if not kwargs:
+        # Filesystem objects are keyed by identity; the cached Constructor
+        # keeps them alive, so the id stays stable.
+        cache_key = id(fs) if isinstance(fs, fsspec.AbstractFileSystem) else str(fs)
+        if (cached := _INCLUDE_CONSTRUCTOR_CACHE.get(cache_key)) is not None:
+            return cached
+
     match fs:
         case str() | os.PathLike():
             filesystem, _ = fsspec.url_to_fs(str(fs))
@@ -164,23 +261,51 @@ def get_include_constructor(
             msg = f"Unsupported filesystem type: {type(fs)}"
             raise TypeError(msg)
 
-    return yaml_include.Constructor(fs=filesystem, **kwargs)
+    constructor = yaml_include.Constructor(fs=filesystem, **kwargs)
+    if cache_key is not None:
+        _INCLUDE_CONSTRUCTOR_CACHE[cache_key] = constructor
+    return constructor
+
+
+# Safe-loader subclasses are a pure function of the base class (plus its
+# registered constructors), so they can be shared between calls.
+_SAFE_LOADER_CACHE: dict[tuple[Any, ...], typedefs.LoaderType] = {}
+
+
+def _noop_constructor(loader: typedefs.LoaderType, node: yaml.Node) -> None:
+    return None
+
+
+def _noop_multi_constructor(
+    loader: typedefs.LoaderType, suffix: str, node: yaml.Node
+) -> None:
+    return None
 
 
 def get_safe_loader(base_loader_cls: typedefs.LoaderType) -> typedefs.LoaderType:
     """Create a SafeLoader with dummy constructors for common tags.
 
+    Results are memoized per base class, keyed on its constructor registry
+    so later registrations on the base invalidate the cached subclass.
+
     Args:
         base_loader_cls: Base loader class to extend
 
     Returns:
         Enhanced safe loader class
     """
+    key = (
+        base_loader_cls,
+        frozenset(base_loader_cls.yaml_constructors.items()),
+        frozenset(base_loader_cls.yaml_multi_constructors.items()),
+    )
+    if (cached := _SAFE_LOADER_CACHE.get(key)) is not None:
+        return cached
     loader_cls = utils.create_subclass(base_loader_cls)
 
     # Add dummy constructors for simple tags
     for tag in ("!include", "!relative"):
-        loader_cls.add_constructor(tag, lambda loader, node: None)
+        loader_cls.add_constructor(tag, _noop_constructor)
 
     # Add dummy constructors for complex tags
     python_tags = (
@@ -188,12 +313,73 @@ def get_safe_loader(base_loader_cls: typedefs.LoaderType) -> typedefs.LoaderType
         "tag:yaml.org,2002:python/object/apply:",
     )
     for tag in python_tags:
-        loader_cls.add_multi_constructor(tag, lambda loader, suffix, node: None)
+        loader_cls.add_multi_constructor(tag, _noop_multi_constructor)
     # https://github.com/smart-home-network-security/pyyaml-loaders/
     # loader_cls.add_multi_constructor("!", lambda loader, suffix, node: None)
+    _SAFE_LOADER_CACHE[key] = loader_cls
     return loader_cls
 
 
+# Memoized loader classes keyed on the full get_loader configuration. Building
+# a subclass + registering constructors per call is measurable on workloads
+# that parse many small YAML strings; identical configurations can share one
+# class. The key includes a fingerprint of the base class's registered
+# constructors (tags and handler identities) so that later registrations on
+# the base (e.g. YAMLParser.register_with_loader) invalidate entries instead
+# of serving a stale subclass.
+_LOADER_CACHE: dict[tuple[Any, ...], typedefs.LoaderType] = {}
+_LOADER_CACHE_LOCK = threading.Lock()
+_LOADER_CACHE_MAXSIZE = 64
+
+
+def _loader_cache_key(
+    base_loader_cls: typedefs.LoaderType,
+    include_base_path: str | os.PathLike[str] | fsspec.AbstractFileSystem | None,
+    enable_include: bool,
+    enable_env: bool,
+    resolve_strings: bool,
+    resolve_dict_keys: bool,
+    jinja_env: jinja2.Environment | None,
+) -> tuple[Any, ...]:
+    # Filesystem objects and Jinja environments are keyed by identity; the
+    # cached loader class keeps them alive via its constructor closures, so
+    # their ids stay stable for the lifetime of the cache entry.
+    fs_key = (
+        id(include_base_path)
+        if isinstance(include_base_path, fsspec.AbstractFileSystem)
+        else str(include_base_path)
+    )
+    return (
+        base_loader_cls,
+        frozenset(base_loader_cls.yaml_constructors.items()),
+        frozenset(base_loader_cls.yaml_multi_constructors.items()),
+        fs_key,
+        enable_include,
+        enable_env,
+        resolve_strings,
+        resolve_dict_keys,
+        id(jinja_env) if jinja_env is not None else None,
+    )
+
+
+def _make_interning_construct_mapping(
+    base_loader_cls: typedefs.LoaderType,
+) -> Callable[..., dict[Any, Any]]:
+    """Build a construct_mapping override that interns string keys.
+
+    Delegates to the base class's construct_mapping and rewrites the result,
+    so tag handling and merge-key flattening stay untouched.
+    """
+
+    def construct_mapping(
+        self: Any, node: yaml.MappingNode, deep: bool = False
+    ) -> dict[Any, Any]:
+        mapping = base_loader_cls.construct_mapping(self, node, deep)
+        return {sys.intern(k) if type(k) is str else k: v for k, v in mapping.items()}
+
+    return construct_mapping
+
+
 def get_loader(
     base_loader_cls: typedefs.LoaderType,
     include_base_path: str | os.PathLike[str] | fsspec.AbstractFileSystem | None = None,
@@ -206,6 +392,10 @@ def get_loader(
 ) -> typedefs.LoaderType:
     """Construct an enhanced YAML loader with optional support for !env and !include tags.
 
+    Loader classes are memoized per configuration (except when `variables` is
+    given, since dictionaries cannot serve as cache keys), so repeated calls
+    with the same options reuse one class instead of rebuilding it.
+
     Args:
         base_loader_cls: Base loader class to extend
         include_base_path: Base path for !include tag resolution. If None, use cwd.
@@ -219,14 +409,47 @@ def get_loader(
     Returns:
         Enhanced loader class
     """
+    # When no constructors would be registered at all, the base class can be
+    # used as-is - no subclass needed.
+    if (
+        not enable_include
+        and not enable_env
+        and not variables
+        and not resolve_strings
+        and not resolve_dict_keys
+    ):
+        return base_loader_cls
+
+    key: tuple[Any, ...] | None = None
+    if variables is None:
+        key = _loader_cache_key(
+            base_loader_cls,
+            include_base_path,
+            enable_include,
+            enable_env,
+            resolve_strings,
+            resolve_dict_keys,
+            jinja_env,
+        )
+        with _LOADER_CACHE_LOCK:
+            if (cached := _LOADER_CACHE.get(key)) is not None:
+                return cached
+
     loader_cls = utils.create_subclass(base_loader_cls)
+    # Configs repeat a small vocabulary of keys across mappings and files;
+    # interning collapses the duplicate strings to one object each, which
+    # trims mapping memory and lets later dict lookups hit the identity
+    # fast path instead of comparing characters.
+    loader_cls.construct_mapping = _make_interning_construct_mapping(  # type: ignore[method-assign]
+        base_loader_cls
+    )
     if variables:
         var_ctor = variable.ConfigConstructor(variables)
         loader_cls.add_constructor("!var", var_ctor.construct_variable)
 
     if enable_include:
         constructor = get_include_constructor(fs=include_base_path)
-        yaml.add_constructor("!include", constructor, loader_cls)
+        loader_cls.add_constructor("!include", constructor)
 
     if enable_env:
         loader_cls.add_constructor("!ENV", get_env_constructor)
@@ -239,9 +462,73 @@ def get_loader(
         )
         loader_cls.add_constructor("tag:yaml.org,2002:str", j_ctor)
 
+    if key is not None:
+        with _LOADER_CACHE_LOCK:
+            if len(_LOADER_CACHE) >= _LOADER_CACHE_MAXSIZE:
+                _LOADER_CACHE.pop(next(iter(_LOADER_CACHE)))
+            _LOADER_CACHE[key] = loader_cls
+
     return loader_cls
 
 
+def _as_path(path: str | os.PathLike[str]) -> pathlib.Path:
+    """Return a plain pathlib.Path for local paths, a UPath for remote URIs.
+
+    UPath's protocol dispatch is pure overhead for the local-file case that
+    dominates INHERIT resolution.
+    """
+    if "://" not in str(path):
+        return pathlib.Path(path)
+    return upath.UPath(path)
+
+
+# Default-configuration loaders for the string modes, built lazily on first
+# use. The fingerprint (constructor counts of the base class) catches tags
+# registered directly on the base loaders after the snapshot was taken.
+_DEFAULT_LOADER_CACHE: dict[str, tuple[typedefs.LoaderType, int]] = {}
+
+
+def _get_default_loader(mode: str) -> typedefs.LoaderType:
+    base = LOADERS[mode]
+    fingerprint = len(base.yaml_constructors) + len(base.yaml_multi_constructors)
+    entry = _DEFAULT_LOADER_CACHE.get(mode)
+    if entry is not None and entry[1] == fingerprint:
+        return entry[0]
+    loader = get_loader(base)
+    _DEFAULT_LOADER_CACHE[mode] = (loader, fingerprint)
+    return loader
+
+
+# Interned so the lookup against interned mapping keys takes dict's
+# identity fast path instead of comparing characters.
+_INHERIT_KEY = sys.intern("INHERIT")
+
+
+def _merge_inherit(child: dict[Any, Any], parent: dict[Any, Any]) -> dict[Any, Any]:
+    """Merge child configuration over parent data, mutating the parent.
+
+    The parent dict is freshly parsed and owned by the INHERIT resolver, so
+    it can absorb the merge in place instead of rebuilding the whole nested
+    structure per inheritance level. Semantics match DeepMerger: dicts merge
+    recursively, lists concatenate parent + child, and the child wins
+    everywhere else.
+    """
+    # A level whose child side holds no containers cannot need recursive or
+    # list merging, so it collapses to a single C-implemented update.
+    if not any(isinstance(v, dict | list) for v in child.values()):
+        parent.update(child)
+        return parent
+    for key, child_value in child.items():
+        parent_value = parent.get(key)
+        if isinstance(child_value, dict) and isinstance(parent_value, dict):
+            _merge_inherit(child_value, parent_value)
+        elif isinstance(child_value, list) and isinstance(parent_value, list):
+            parent[key] = parent_value + child_value
+        else:
+            parent[key] = child_value
+    return parent
+
+
 def _resolve_inherit(
     data: Any,
     base_dir: str | os.PathLike[str] | None,
@@ -250,6 +537,8 @@ def _resolve_inherit(
     resolve_strings: bool,
     resolve_dict_keys: bool,
     jinja_env: jinja2.Environment | None,
+    seen: frozenset[str] = frozenset(),
+    memo: dict[str, Any] | None = None,
 ) -> Any:
     """Resolve INHERIT directive in YAML data.
 
@@ -261,31 +550,56 @@ def _resolve_inherit(
         resolve_strings: Whether to resolve Jinja2 strings
         resolve_dict_keys: Whether to resolve dictionary keys
         jinja_env: Optional Jinja2 environment
+        seen: Absolute paths already on the inheritance chain, for cycle
+              detection
+        memo: Per-walk cache of already-resolved parents, so diamond
+              inheritance parses each file once per top-level load
 
     Returns:
         Merged configuration data
+
+    Raises:
+        RecursionError: If the INHERIT chain is circular
     """
-    if not isinstance(data, dict) or "INHERIT" not in data or base_dir is None:
+    if not isinstance(data, dict) or _INHERIT_KEY not in data or base_dir is None:
         return data
 
-    parent_path = data.pop("INHERIT")
+    parent_path = data.pop(_INHERIT_KEY)
     if not parent_path:
         return data
 
-    import upath
-
-    base_dir = upath.UPath(base_dir)
+    base_dir = _as_path(base_dir)
+    # Sibling lookups during the walk are pure string work for local
+    # directories; os.path.join is much cheaper than Path division, which
+    # re-parses and allocates path parts on every edge.
+    base_dir_str = str(base_dir) if "://" not in str(base_dir) else None
     # Convert string to list for uniform handling
     file_paths = [parent_path] if isinstance(parent_path, str) else parent_path
-    context = deepmerge.DeepMerger()
-
-    # Process inheritance in reverse order (last file is base configuration)
-    for p_path in reversed(file_paths):
-        parent_cfg = base_dir / p_path
+    if memo is None:
+        memo = {}
+
+    def load_parent(p_path: str) -> Any:
+        parent_cfg = (
+            os.path.join(base_dir_str, p_path)  # noqa: PTH118
+            if base_dir_str is not None
+            else base_dir / p_path
+        )
+        # Detect circular INHERIT chains up front instead of recursing until
+        # the interpreter stack blows. RecursionError is kept for
+        # backwards compatibility with the stack-overflow failure mode.
+        key = os.path.abspath(parent_cfg)  # noqa: PTH100
+        if key in seen:
+            msg = f"Circular INHERIT detected: {parent_cfg}"
+            raise RecursionError(msg)
+        # Diamond inheritance revisits parents; serve those from the per-walk
+        # memo. The merge mutates parent mappings in place, so the memo keeps
+        # the pristine result and every consumer gets its own copy.
+        if key in memo:
+            return copy.deepcopy(memo[key])
         logger.debug(
             "Loading parent configuration file %r relative to %r", parent_cfg, base_dir
         )
-        parent_data = load_yaml_file(
+        result = load_yaml_file(
             parent_cfg,
             mode=mode,
             include_base_path=include_base_path,
@@ -293,8 +607,29 @@ def _resolve_inherit(
             resolve_strings=resolve_strings,
             resolve_dict_keys=resolve_dict_keys,
             jinja_env=jinja_env,
+            _seen=seen | {key},
+            _memo=memo,
         )
-        data = context.merge(data, parent_data)
+        memo[key] = result
+        return copy.deepcopy(result)
+
+    # Parent loads are independent until the merge step, so multi-parent
+    # configurations fetch and parse concurrently (I/O and libyaml parsing
+    # both release the GIL). The merge itself stays ordered.
+    if len(file_paths) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+            parents = list(executor.map(load_parent, file_paths))
+    else:
+        parents = [load_parent(file_paths[0])]
+
+    # Process inheritance in reverse order (last file is base configuration)
+    for parent_data in reversed(parents):
+        if isinstance(parent_data, dict):
+            data = _merge_inherit(data, parent_data)
+        else:
+            data = deepmerge.DeepMerger().merge(data, parent_data)
 
     return data
 
@@ -309,6 +644,7 @@ def load_yaml(
     resolve_inherit: bool = False,
     variables: dict[str, Any] | None = None,
     jinja_env: jinja2.Environment | None = None,
+    source_path: str | os.PathLike[str] | None = None,
     verify_type: None = None,
 ) -> Any: ...
 
@@ -323,6 +659,7 @@ def load_yaml(
     resolve_inherit: bool = False,
     variables: dict[str, Any] | None = None,
     jinja_env: jinja2.Environment | None = None,
+    source_path: str | os.PathLike[str] | None = None,
     verify_type: type[TVerify] = ...,
 ) -> TVerify: ...
 
@@ -336,6 +673,7 @@ def load_yaml(
     resolve_inherit: bool = False,
     variables: dict[str, Any] | None = None,
     jinja_env: jinja2.Environment | None = None,
+    source_path: str | os.PathLike[str] | None = None,
     verify_type: type[TVerify] | None = None,
 ) -> Any | TVerify:
     r"""Load a YAML string with specified safety mode and include path support.
@@ -348,9 +686,12 @@ def load_yaml(
         resolve_strings: Whether to resolve Jinja2 template strings
         resolve_dict_keys: Whether to resolve Jinja2 templates in dictionary keys
         resolve_inherit: Whether to resolve INHERIT directives
-                         (requires IO object with name attribute for text)
+                         (requires source_path or an IO object with a name
+                         attribute for text)
         jinja_env: Optional Jinja2 environment for template resolution
         variables: An optional dictionary to resolving !var tags
+        source_path: Path the YAML came from, used to resolve INHERIT
+                     relative to the file
         verify_type: Type to verify and cast the output to
 
     Returns:
@@ -376,24 +717,37 @@ def load_yaml(
         ```
     """
     try:
-        if isinstance(mode, str):
-            base_loader_cls: type = LOADERS[mode]
+        # Fast path for the default configuration: reuse a per-mode loader
+        # singleton instead of re-running the full get_loader setup.
+        if (
+            isinstance(mode, str)
+            and include_base_path is None
+            and not resolve_strings
+            and not resolve_dict_keys
+            and variables is None
+            and jinja_env is None
+        ):
+            loader = _get_default_loader(mode)
         else:
-            base_loader_cls = mode
-        loader = get_loader(
-            base_loader_cls,
-            include_base_path=include_base_path,
-            resolve_strings=resolve_strings,
-            resolve_dict_keys=resolve_dict_keys,
-            variables=variables,
-            jinja_env=jinja_env,
-        )
+            base_loader_cls: type = LOADERS[mode] if isinstance(mode, str) else mode
+            loader = get_loader(
+                base_loader_cls,
+                include_base_path=include_base_path,
+                resolve_strings=resolve_strings,
+                resolve_dict_keys=resolve_dict_keys,
+                variables=variables,
+                jinja_env=jinja_env,
+            )
         data = yaml.load(text, Loader=loader)
 
-        if resolve_inherit and hasattr(text, "name"):
-            import upath
-
-            base_dir = upath.UPath(text.name).parent
+        # An explicit source_path takes priority; the .name fallback keeps
+        # working for file objects opened from disk.
+        if resolve_inherit and (
+            origin := source_path
+            if source_path is not None
+            else getattr(text, "name", None)
+        ):
+            base_dir = _as_path(origin).parent
             data = _resolve_inherit(
                 data,
                 base_dir,
@@ -421,6 +775,29 @@ def load_yaml(
         return data
 
 
+# Opt-in parse cache for load_yaml_file, keyed on file identity (absolute
+# path, mtime, size) plus the loader mode. Only engaged for local files
+# loaded with the default feature set, where the result depends on file
+# content alone. Entries are deepcopied on store and on hit so cached data
+# is never shared with callers.
+_FILE_PARSE_CACHE: dict[tuple[str, int, int, str], Any] = {}
+_FILE_PARSE_CACHE_LOCK = threading.Lock()
+_FILE_PARSE_CACHE_MAXSIZE = 256
+# Distinguishes "not cached" from a document that parses to None.
+_CACHE_MISS = object()
+
+
+def _file_cache_key(path_obj: pathlib.Path, mode: str) -> tuple[str, int, int, str]:
+    st = path_obj.stat()
+    mtime_ns = getattr(st, "st_mtime_ns", None) or int(st.st_mtime * 1e9)
+    return (os.path.abspath(path_obj), mtime_ns, st.st_size, mode)  # noqa: PTH100
+
+
+def clear_file_cache() -> None:
+    """Clear the opt-in parse cache used by `load_yaml_file(use_cache=True)`."""
+    _FILE_PARSE_CACHE.clear()
+
+
 @overload
 def load_yaml_file(
     path: str | os.PathLike[str],
@@ -432,7 +809,10 @@ def load_yaml_file(
     jinja_env: jinja2.Environment | None = None,
     variables: dict[str, Any] | None = None,
     storage_options: dict[str, Any] | None = None,
+    use_cache: bool = False,
     verify_type: None = None,
+    _seen: frozenset[str] = frozenset(),
+    _memo: dict[str, Any] | None = None,
 ) -> Any: ...
 
 
@@ -447,7 +827,10 @@ def load_yaml_file(
     jinja_env: jinja2.Environment | None = None,
     variables: dict[str, Any] | None = None,
     storage_options: dict[str, Any] | None = None,
+    use_cache: bool = False,
     verify_type: type[TVerify] = ...,
+    _seen: frozenset[str] = frozenset(),
+    _memo: dict[str, Any] | None = None,
 ) -> TVerify: ...
 
 
@@ -461,7 +844,10 @@ def load_yaml_file(
     jinja_env: jinja2.Environment | None = None,
     variables: dict[str, Any] | None = None,
     storage_options: dict[str, Any] | None = None,
+    use_cache: bool = False,
     verify_type: type[TVerify] | None = None,
+    _seen: frozenset[str] = frozenset(),
+    _memo: dict[str, Any] | None = None,
 ) -> Any | TVerify:
     """Load a YAML file with specified options.
 
@@ -478,6 +864,8 @@ def load_yaml_file(
         jinja_env: Optional Jinja2 environment for template resolution
         variables: An optional dictionary to resolving !var tags
         storage_options: Additional keywords to pass to fsspec backend
+        use_cache: Whether to serve repeated loads of an unchanged local file
+                   from an in-memory cache keyed on path, mtime and size
         verify_type: Checks for the correct output type (eg. dict)
 
     Returns:
@@ -500,20 +888,75 @@ def load_yaml_file(
         ```
     """
     try:
-        import upath
-
-        path_obj = upath.UPath(path, **storage_options or {}).resolve()
-        text = path_obj.read_text("utf-8")
-
-        data = load_yaml(
-            text,
-            mode=mode,
-            include_base_path=include_base_path,
-            resolve_strings=resolve_strings,
-            resolve_dict_keys=resolve_dict_keys,
-            resolve_inherit=False,  # We'll handle inheritance separately
-            jinja_env=jinja_env,
-        )
+        # Local paths take the plain pathlib route; UPath (fsspec dispatch) is
+        # only needed for remote URIs or explicit storage options.
+        path_obj: pathlib.Path
+        cache_key: tuple[str, int, int, str] | None = None
+        cache_hit = False
+        if not storage_options and "://" not in str(path):
+            path_obj = pathlib.Path(path)
+            if resolve_inherit:
+                # Canonicalize so INHERIT siblings of a symlinked config are
+                # looked up next to the real file, not next to the symlink.
+                path_obj = path_obj.resolve()
+            # The cache is only safe when the parse depends on file content
+            # alone, i.e. none of the constructor-level features are active.
+            if (
+                use_cache
+                and isinstance(mode, str)
+                and include_base_path is None
+                and not resolve_inherit
+                and not resolve_strings
+                and not resolve_dict_keys
+                and jinja_env is None
+                and variables is None
+            ):
+                cache_key = _file_cache_key(path_obj, mode)
+                cached = _FILE_PARSE_CACHE.get(cache_key, _CACHE_MISS)
+                if cached is not _CACHE_MISS:
+                    data = copy.deepcopy(cached)
+                    cache_hit = True
+            if not cache_hit:
+                with path_obj.open("rb") as f:
+                    # Large files stream straight into libyaml (which decodes
+                    # and parses incrementally) instead of being buffered in
+                    # full.
+                    source: YAMLInput = (
+                        f
+                        if os.fstat(f.fileno()).st_size > _STREAM_SIZE_THRESHOLD
+                        else f.read()
+                    )
+                    data = load_yaml(
+                        source,
+                        mode=mode,
+                        include_base_path=include_base_path,
+                        resolve_strings=resolve_strings,
+                        resolve_dict_keys=resolve_dict_keys,
+                        resolve_inherit=False,  # Inheritance handled separately
+                        jinja_env=jinja_env,
+                    )
+                if cache_key is not None:
+                    value = copy.deepcopy(data)
+                    # Concurrent loaders (load_many_yaml_files) store and
+                    # evict from different threads; the lock keeps eviction
+                    # from racing.
+                    with _FILE_PARSE_CACHE_LOCK:
+                        if len(_FILE_PARSE_CACHE) >= _FILE_PARSE_CACHE_MAXSIZE:
+                            _FILE_PARSE_CACHE.pop(next(iter(_FILE_PARSE_CACHE)))
+                        _FILE_PARSE_CACHE[cache_key] = value
+        else:
+            path_obj = upath.UPath(path, **storage_options or {}).resolve()
+            # Pass raw bytes through: the YAML reader BOM-sniffs and decodes
+            # (in C with libyaml), saving a Python-level decode pass.
+            data = load_yaml(
+                path_obj.read_bytes(),
+                mode=mode,
+                include_base_path=include_base_path,
+                resolve_strings=resolve_strings,
+                resolve_dict_keys=resolve_dict_keys,
+                resolve_inherit=False,  # We'll handle inheritance separately
+                jinja_env=jinja_env,
+            )
 
         if resolve_inherit:
             data = _resolve_inherit(
@@ -524,6 +967,8 @@ def load_yaml_file(
                 resolve_strings=resolve_strings,
                 resolve_dict_keys=resolve_dict_keys,
                 jinja_env=jinja_env,
+                seen=_seen | {os.path.abspath(path_obj)},  # noqa: PTH100
+                memo=_memo,
             )
     except (OSError, yaml.YAMLError):
         logger.exception("Failed to load YAML file %r", path)
@@ -540,6 +985,71 @@ def load_yaml_file(
         return data
 
 
+def load_many_yaml_files(
+    paths: Iterable[str | os.PathLike[str]],
+    mode: typedefs.LoaderStr | typedefs.LoaderType = "unsafe",
+    max_workers: int | None = None,
+    **kwargs: Any,
+) -> list[Any]:
+    """Load multiple YAML files concurrently.
+
+    File reads and libyaml parsing both release the GIL, so scanning a
+    directory of configs (especially on network filesystems) parallelizes
+    well across a thread pool. Results come back in input order.
+
+    Args:
+        paths: Paths to the YAML files to load
+        mode: YAML loader safety mode ('unsafe', 'full', or 'safe').
+              Custom YAML loader classes are also accepted.
+        max_workers: Thread pool size; defaults to a size based on CPU count
+        **kwargs: Additional keyword arguments passed to `load_yaml_file`
+
+    Returns:
+        List of parsed YAML data, in the same order as the input paths
+
+    Example:
+        ```python
+        configs = load_many_yaml_files(sorted(config_dir.glob("*.yml")))
+        ```
+    """
+    path_list = list(paths)
+    if len(path_list) <= 1:
+        return [load_yaml_file(p, mode=mode, **kwargs) for p in path_list]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = max_workers or min(32, (os.cpu_count() or 1) * 4, len(path_list))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(lambda p: load_yaml_file(p, mode=mode, **kwargs), path_list)
+        )
+
+
+async def aload_yaml_file(
+    path: str | os.PathLike[str],
+    mode: typedefs.LoaderStr | typedefs.LoaderType = "unsafe",
+    **kwargs: Any,
+) -> Any:
+    """Load a YAML file without blocking the event loop.
+
+    Runs `load_yaml_file` in a worker thread via `asyncio.to_thread`; libyaml
+    releases the GIL while parsing, so several awaited loads genuinely run in
+    parallel. For bulk loads from sync code use `load_many_yaml_files`.
+
+    Args:
+        path: Path to the YAML file to load
+        mode: YAML loader safety mode ('unsafe', 'full', or 'safe').
+              Custom YAML loader classes are also accepted.
+        **kwargs: Additional keyword arguments passed to `load_yaml_file`
+
+    Returns:
+        Parsed YAML data
+    """
+    import asyncio
+
+    return await asyncio.to_thread(load_yaml_file, path, mode=mode, **kwargs)
+
+
 if __name__ == "__main__":
     obj = load_yaml("- test")
     print(obj)
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 import tomllib
 from typing import TYPE_CHECKING
 
 import pytest
 import yaml
 
-from yamling.dump_universal import dump, dump_file
+from yamling.dump_universal import dump, dump_bytes, dump_file, dump_many
 from yamling.exceptions import DumpingError
+from yamling.load_universal import load, load_file
 
 
 if TYPE_CHECKING:
@@ -197,3 +200,65 @@ def test_dump_nested_lists():
     # For TOML, wrap the list in a dictionary
     result = dump({"array": nested_list}, "toml")
     assert result
+
+
+def test_dump_bytes_roundtrip():
+    for format_type in ["yaml", "json", "toml"]:
+        payload = dump_bytes(SAMPLE_DICT, format_type)  # type: ignore
+        assert isinstance(payload, bytes)
+        assert load(payload, format_type) == SAMPLE_DICT  # type: ignore
+
+
+def test_dump_bytes_unsupported_format():
+    with pytest.raises(ValueError, match="Unsupported format: invalid"):
+        dump_bytes(SAMPLE_DICT, "invalid")  # type: ignore
+
+
+def test_dump_many_json():
+    records = [{"a": 1}, {"b": 2}]
+    # Records may span multiple lines (indented JSON), so split on an
+    # explicit separator that cannot occur inside them
+    payload = dump_many(records, "json", sep=b"\x00")
+    assert [json.loads(part) for part in payload.split(b"\x00")] == records
+
+
+def test_dump_many_json_default_sep():
+    assert dump_many([1, 2, 3], "json") == b"1\n2\n3"
+
+
+def test_dump_many_yaml_multidoc():
+    records = [{"a": 1}, {"b": 2}]
+    payload = dump_many(records, "yaml")
+    assert list(yaml.safe_load_all(payload.decode("utf-8"))) == records
+
+
+def test_dump_many_unsupported_format():
+    with pytest.raises(ValueError, match="Unsupported format: invalid"):
+        dump_many([SAMPLE_DICT], "invalid")  # type: ignore
+
+
+def test_dump_file_write_cache_roundtrip(tmp_path: Path):
+    test_file = tmp_path / "test.yaml"
+    dump_file(SAMPLE_DICT, test_file, write_cache=True)
+    sidecar = tmp_path / "test.yaml.pcache"
+    assert sidecar.exists()
+    assert load_file(test_file, use_cache=True) == SAMPLE_DICT
+
+    # Prove the sidecar is actually served: break the source file but keep
+    # the sidecar fresher than it, so the pickled payload must be returned
+    test_file.write_text("{invalid yaml")
+    future = time.time() + 10
+    os.utime(sidecar, (future, future))
+    assert load_file(test_file, use_cache=True) == SAMPLE_DICT
+
+
+def test_dump_file_write_cache_invalidation(tmp_path: Path):
+    test_file = tmp_path / "test.yaml"
+    dump_file(SAMPLE_DICT, test_file, write_cache=True)
+    assert load_file(test_file, use_cache=True) == SAMPLE_DICT
+
+    # A source newer than its sidecar must be re-parsed, not served stale
+    test_file.write_text("key: changed")
+    future = time.time() + 10
+    os.utime(test_file, (future, future))
+    assert load_file(test_file, use_cache=True) == {"key": "changed"}
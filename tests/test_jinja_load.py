@@ -223,6 +223,22 @@ def test_unicode_strings(basic_jinja_env):
     assert result == {"greeting": "Hello John 👋"}
 
 
+def test_custom_delimiter_resolution():
+    """Environments with non-default delimiters must not hit the fast-reject."""
+    env = jinja2.Environment(
+        variable_start_string="<<",
+        variable_end_string=">>",
+        autoescape=False,
+    )
+    env.globals["name"] = "John"
+    result = load_yaml(
+        yaml.dump({"greeting": "Hello << name >>!"}),
+        resolve_strings=True,
+        jinja_env=env,
+    )
+    assert result == {"greeting": "Hello John!"}
+
+
 def test_mixed_resolution(basic_jinja_env):
     """Test mixing template and non-template strings."""
     mixed_dict = {
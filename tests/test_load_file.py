@@ -10,6 +10,7 @@ This module tests the YAML loading capabilities including:
 
 # ruff: noqa: PLR2004
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -22,119 +23,119 @@ if TYPE_CHECKING:
     from yamling import typedefs
 
 
-@pytest.fixture
-def yaml_files(tmp_path: Path) -> Path:
-    """Create test YAML files in a temporary directory.
-
-    Creates a test suite of YAML files with different inheritance patterns:
-    - base.yaml: Base configuration without inheritance
-    - feature.yaml: Single inheritance from base
-    - multi.yaml: Multiple inheritance from base and feature
-    - nested.yaml: Nested inheritance through feature
-    - invalid.yaml: Invalid inheritance (missing parent)
-    - circular1.yaml/circular2.yaml: Circular inheritance pattern
-
-    Args:
-        tmp_path: Pytest's temporary directory fixture
-
-    Returns:
-        Path to the temporary directory containing the test files
-    """
+# Fixture file contents, keyed by file stem. Kept at module level so the
+# fixture below just writes them out; the literals are pre-stripped bytes,
+# letting write_bytes skip the per-write UTF-8 encode.
+FILE_CONTENTS = {
     # Base configuration
-    (tmp_path / "base.yaml").write_text(
-        """
+    "base": b"""\
 name: base
 version: '1.0'
 settings:
   timeout: 30
   retries: 3
-""".lstrip()
-    )
-
+""",
     # Feature configuration with single inheritance
-    (tmp_path / "feature.yaml").write_text(
-        """
+    "feature": b"""\
 INHERIT: base.yaml
 name: feature
 settings:
   timeout: 60
-""".lstrip()
-    )
-
+""",
     # Multi-inheritance configuration
-    (tmp_path / "multi.yaml").write_text(
-        """
+    "multi": b"""\
 INHERIT: [base.yaml, feature.yaml]
 name: multi
 extra: value
-""".lstrip()
-    )
-
+""",
     # Nested inheritance configuration
-    (tmp_path / "nested.yaml").write_text(
-        """
+    "nested": b"""\
 INHERIT: feature.yaml
 name: nested
 settings:
   new_setting: true
-""".lstrip()
-    )
-
+""",
     # Invalid configuration with non-existent parent
-    (tmp_path / "invalid.yaml").write_text(
-        """
+    "invalid": b"""\
 INHERIT: nonexistent.yaml
 name: invalid
-""".lstrip()
-    )
-
+""",
     # Circular inheritance configurations
-    (tmp_path / "circular1.yaml").write_text(
-        """
+    "circular1": b"""\
 INHERIT: circular2.yaml
 name: circular1
-""".lstrip()
-    )
-
-    (tmp_path / "circular2.yaml").write_text(
-        """
+""",
+    "circular2": b"""\
 INHERIT: circular1.yaml
 name: circular2
-""".lstrip()
-    )
+""",
+}
+
+
+@pytest.fixture(scope="module")
+def yaml_files(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Create test YAML files in a temporary directory, once per module.
+
+    Creates a test suite of YAML files with different inheritance patterns:
+    - base.yaml: Base configuration without inheritance
+    - feature.yaml: Single inheritance from base
+    - multi.yaml: Multiple inheritance from base and feature
+    - nested.yaml: Nested inheritance through feature
+    - invalid.yaml: Invalid inheritance (missing parent)
+    - circular1.yaml/circular2.yaml: Circular inheritance pattern
+
+    The tests only read the files, so they are written once per module via
+    tmp_path_factory instead of once per test.
+
+    Args:
+        tmp_path_factory: Pytest's session-scoped temporary directory factory
+
+    Returns:
+        Mapping of file stem to the path of the written file
+    """
+    tmp_path = tmp_path_factory.mktemp("yaml_files")
+
+    def write(item: tuple[str, bytes]) -> tuple[str, Path]:
+        name, content = item
+        path = tmp_path / f"{name}.yaml"
+        path.write_bytes(content)
+        return name, path
 
-    return tmp_path
+    # The writes are independent, so overlap the open/write/close syscalls
+    # instead of paying their latency sequentially.
+    with ThreadPoolExecutor(max_workers=len(FILE_CONTENTS)) as executor:
+        return dict(executor.map(write, FILE_CONTENTS.items()))
 
 
-def test_load_basic(yaml_files: Path) -> None:
+def test_load_basic(yaml_files: dict[str, Path]) -> None:
     """Test loading a YAML file without inheritance."""
-    result = load_yaml_file(yaml_files / "base.yaml")
+    result = load_yaml_file(yaml_files["base"])
     assert result["name"] == "base"
     assert result["version"] == "1.0"
     assert result["settings"]["timeout"] == 30
     assert result["settings"]["retries"] == 3
 
 
-def test_single_inheritance(yaml_files: Path) -> None:
+def test_single_inheritance(yaml_files: dict[str, Path]) -> None:
     """Test loading a YAML file with single inheritance.
 
     !!! note
         Tests both value inheritance and override behavior.
     """
-    result = load_yaml_file(yaml_files / "feature.yaml", resolve_inherit=True)
+    result = load_yaml_file(yaml_files["feature"], resolve_inherit=True)
     assert result["name"] == "feature"  # Overridden value
     assert result["version"] == "1.0"  # Inherited value
     assert result["settings"]["timeout"] == 60  # Overridden value
     assert result["settings"]["retries"] == 3  # Inherited value
 
 
-def test_multiple_inheritance(yaml_files: Path) -> None:
+def test_multiple_inheritance(yaml_files: dict[str, Path]) -> None:
     """Test loading a YAML file with multiple inheritance.
 
     !!! note
         Verifies the inheritance precedence: last inherited file wins.
     """
-    result = load_yaml_file(yaml_files / "multi.yaml", resolve_inherit=True)
+    result = load_yaml_file(yaml_files["multi"], resolve_inherit=True)
     assert result["name"] == "multi"  # Last override wins
     assert result["version"] == "1.0"  # From base
     assert result["settings"]["timeout"] == 60  # From feature
@@ -142,13 +143,13 @@ def test_multiple_inheritance(yaml_files: Path) -> None:
     assert result["extra"] == "value"  # Own value
 
 
-def test_nested_inheritance(yaml_files: Path) -> None:
+def test_nested_inheritance(yaml_files: dict[str, Path]) -> None:
     """Test loading a YAML file with nested inheritance.
 
     !!! note
         Verifies that multi-level inheritance works correctly.
     """
-    result = load_yaml_file(yaml_files / "nested.yaml", resolve_inherit=True)
+    result = load_yaml_file(yaml_files["nested"], resolve_inherit=True)
     assert result["name"] == "nested"  # Own value
     assert result["version"] == "1.0"  # From base through feature
     assert result["settings"]["timeout"] == 60  # From feature
@@ -156,20 +157,20 @@ def test_nested_inheritance(yaml_files: Path) -> None:
     assert result["settings"]["new_setting"] is True  # Own value
 
 
-def test_inheritance_disabled(yaml_files: Path) -> None:
+def test_inheritance_disabled(yaml_files: dict[str, Path]) -> None:
     """Test that inheritance is not resolved when disabled.
 
     !!! note
         Ensures that INHERIT directives are ignored when resolve_inherit=False.
     """
-    result = load_yaml_file(yaml_files / "feature.yaml", resolve_inherit=False)
+    result = load_yaml_file(yaml_files["feature"], resolve_inherit=False)
     assert result["name"] == "feature"
     assert "version" not in result
     assert result["settings"]["timeout"] == 60
     assert "retries" not in result["settings"]
 
 
-def test_different_loader_modes(yaml_files: Path) -> None:
+def test_different_loader_modes(yaml_files: dict[str, Path]) -> None:
     """Test loading with different safety modes.
 
     Tests all available loader modes:
@@ -179,11 +180,11 @@ def test_different_loader_modes(yaml_files: Path) -> None:
     """
     modes: list[typedefs.LoaderStr] = ["unsafe", "full", "safe"]
     for mode in modes:
-        result = load_yaml_file(yaml_files / "base.yaml", mode=mode)
+        result = load_yaml_file(yaml_files["base"], mode=mode)
         assert result["name"] == "base"
 
 
-def test_missing_parent_file(yaml_files: Path) -> None:
+def test_missing_parent_file(yaml_files: dict[str, Path]) -> None:
     """Test error handling when parent file doesn't exist.
 
     !!! warning
@@ -191,10 +192,12 @@ def test_missing_parent_file(yaml_files: Path) -> None:
         from non-existent files.
     """
     with pytest.raises(FileNotFoundError):
-        load_yaml_file(yaml_files / "invalid.yaml", resolve_inherit=True)
+        load_yaml_file(yaml_files["invalid"], resolve_inherit=True)
 
 
-def test_inheritance_cycle_detection(yaml_files: Path, recursion_limit: Any) -> None:
+def test_inheritance_cycle_detection(
+    yaml_files: dict[str, Path], recursion_limit: Any
+) -> None:
     """Test that circular inheritance is handled properly.
 
     !!! warning
@@ -203,7 +206,7 @@ def test_inheritance_cycle_detection(yaml_files: Path, recursion_limit: Any) ->
     """
     # Set recursion limit very low to fail fast on cycles
     with recursion_limit(100), pytest.raises(RecursionError):
-        load_yaml_file(yaml_files / "circular1.yaml", resolve_inherit=True)
+        load_yaml_file(yaml_files["circular1"], resolve_inherit=True)
 
 
 def test_nonexistent_file() -> None:
@@ -4,7 +4,7 @@ from pathlib import Path
 import pytest
 
 from yamling.exceptions import ParsingError
-from yamling.load_universal import load, load_file
+from yamling.load_universal import load, load_file, load_files
 
 
 # Test Constants
@@ -203,3 +203,17 @@ def test_load_file_with_different_path_types(setup_temp_files: Path):
     # Test with Path object
     result2 = load_file(Path(setup_temp_files / "test.yaml"))
     assert result2 == EXPECTED_DATA
+
+
+# Test load_files() batch function
+def test_load_files(setup_temp_files: Path):
+    results = load_files([
+        setup_temp_files / "test.yaml",
+        setup_temp_files / "test.json",
+        setup_temp_files / "test.toml",
+    ])
+    assert results == [EXPECTED_DATA, EXPECTED_DATA, EXPECTED_DATA]
+
+
+def test_load_files_empty():
+    assert load_files([]) == []
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import io
 import os
 from typing import TYPE_CHECKING
@@ -90,6 +91,39 @@ def test_get_loader():
     assert "!ENV" not in loader.yaml_constructors
 
 
+def test_get_loader_no_options_returns_base():
+    """Test that get_loader skips subclassing when nothing is registered."""
+    loader = yaml_loaders.get_loader(
+        yaml.SafeLoader, enable_include=False, enable_env=False
+    )
+    assert loader is yaml.SafeLoader
+
+
+def test_get_loader_does_not_mutate_base():
+    """Test that constructor registration stays on the subclass."""
+    yaml_loaders.get_loader(yaml.SafeLoader)
+    assert "!ENV" not in yaml.SafeLoader.yaml_constructors
+    assert "!include" not in yaml.SafeLoader.yaml_constructors
+
+
+def test_get_loader_caching():
+    """Test that get_loader reuses loader classes for identical configurations."""
+    first = yaml_loaders.get_loader(yaml.SafeLoader)
+    second = yaml_loaders.get_loader(yaml.SafeLoader)
+    assert first is second
+
+    other = yaml_loaders.get_loader(yaml.SafeLoader, enable_env=False)
+    assert other is not first
+
+    # Registering a new tag on the base class must invalidate cached subclasses
+    base = type("CacheTestLoader", (yaml.SafeLoader,), {})
+    before = yaml_loaders.get_loader(base)
+    base.add_constructor("!cache_test", lambda loader, node: None)
+    after = yaml_loaders.get_loader(base)
+    assert after is not before
+    assert "!cache_test" in after.yaml_constructors
+
+
 def test_load_yaml_with_include(tmp_path: pathlib.Path):
     """Test load_yaml with include path."""
     include_file = tmp_path / "include.yaml"
@@ -109,6 +143,72 @@ def test_load_yaml_with_modes():
     assert yamling.load_yaml(yaml_str, mode="unsafe") is os.system
 
 
+def test_load_many_yaml_files(tmp_path: pathlib.Path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"file_{i}.yaml"
+        path.write_text(f"index: {i}")
+        paths.append(path)
+    results = yamling.load_many_yaml_files(paths)
+    assert results == [{"index": 0}, {"index": 1}, {"index": 2}]
+    assert yamling.load_many_yaml_files([]) == []
+
+
+def test_aload_yaml_file(temp_yaml_file: pathlib.Path):
+    result = asyncio.run(yamling.aload_yaml_file(temp_yaml_file))
+    assert result == {"test": "value"}
+
+
+def test_load_yaml_file_cache_none_value(tmp_path: pathlib.Path):
+    yaml_loaders.clear_file_cache()
+    file_path = tmp_path / "cached.yaml"
+    file_path.write_text("# comment!")
+    original = file_path.stat()
+    assert yamling.load_yaml_file(file_path, use_cache=True) is None
+
+    # A None parse must be cached too: rewrite the file with same-size real
+    # content and restore the mtime, so a cache hit still serves None
+    file_path.write_text("key: val12")
+    os.utime(file_path, ns=(original.st_atime_ns, original.st_mtime_ns))
+    assert yamling.load_yaml_file(file_path, use_cache=True) is None
+
+
+def test_load_yaml_file_cache_invalidation(tmp_path: pathlib.Path):
+    yaml_loaders.clear_file_cache()
+    file_path = tmp_path / "cached.yaml"
+    file_path.write_text("key: 1")
+    assert yamling.load_yaml_file(file_path, use_cache=True) == {"key": 1}
+
+    # Changed content with a bumped mtime must be re-parsed, not served stale
+    file_path.write_text("key: 2")
+    future = file_path.stat().st_mtime + 10
+    os.utime(file_path, (future, future))
+    assert yamling.load_yaml_file(file_path, use_cache=True) == {"key": 2}
+
+
+def test_load_yaml_file_cache_mutation_safety(tmp_path: pathlib.Path):
+    yaml_loaders.clear_file_cache()
+    file_path = tmp_path / "cached.yaml"
+    file_path.write_text("key: [1, 2]")
+    first = yamling.load_yaml_file(file_path, use_cache=True)
+    first["key"].append(3)
+    first["extra"] = True
+    assert yamling.load_yaml_file(file_path, use_cache=True) == {"key": [1, 2]}
+
+
+def test_load_many_yaml_files_use_cache(tmp_path: pathlib.Path):
+    yaml_loaders.clear_file_cache()
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"file_{i}.yaml"
+        path.write_text(f"index: {i}")
+        paths.append(path)
+    expected = [{"index": 0}, {"index": 1}, {"index": 2}]
+    assert yamling.load_many_yaml_files(paths, use_cache=True) == expected
+    # Second pass is served from the parse cache and must match
+    assert yamling.load_many_yaml_files(paths, use_cache=True) == expected
+
+
 def test_load_yaml_accepts_textio():
     # Test data
     yaml_content = """